@@ -1,13 +1,97 @@
-import streamlit as st
+import copy
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from urllib.parse import unquote, urlparse
+
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
-from urllib.parse import unquote
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # ============================================================================
 # Data Loading Functions
 # ============================================================================
 
 
+# Aggregation columns used by the dashboard; everything else is skipped at parse time
+NEEDED_COLS = (
+    "marketUnits050Sum",
+    "marketUnits51100Sum",
+    "marketUnits101150Sum",
+    "marketUnits151200Sum",
+    "marketUnits201250Sum",
+    "marketUnits251Sum",
+    "countMarket0BrSum",
+    "countMarket1BrSum",
+    "countMarket2BrSum",
+    "countMarket3BrSum",
+    "surfaceParkingStallsSum",
+    "garageParkingStallsSum",
+    "podiumParkingStallsSum",
+    "structuredParkingStallsSum",
+    "undergroundParkingStallsSum",
+    "totalUnitsSum",
+    "affordableUnitsSum",
+)
+
+
+@st.cache_resource
+def _session():
+    """Shared HTTP session so scenario downloads reuse pooled connections."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return session
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_csv(url):
+    """Download and parse an aggregation CSV, cached per URL across reruns."""
+    if urlparse(url).scheme in ("http", "https"):
+        response = _session().get(url, timeout=10)
+        response.raise_for_status()
+        source = response.content
+    else:
+        # Local paths and other schemes are left to pandas to open
+        source = url
+
+    try:
+        return pd.read_csv(
+            io.BytesIO(source) if isinstance(source, bytes) else source,
+            engine="pyarrow",
+            usecols=list(NEEDED_COLS),
+            dtype=np.float64,
+        )
+    except KeyError:
+        # Some needed columns are absent; keep the ones present and let the
+        # caller fill the rest with zeros
+        df = pd.read_csv(
+            io.BytesIO(source) if isinstance(source, bytes) else source,
+            engine="pyarrow",
+        )
+        return df[[c for c in NEEDED_COLS if c in df.columns]].astype(np.float64)
+
+
+def _whole_numbers(values):
+    """Cast values to int64 when every entry is whole, so tables show 1, not 1.0."""
+    values = np.asarray(values)
+    if np.all(np.mod(values, 1) == 0):
+        return values.astype(np.int64)
+    return values
+
+
+def _pct(values):
+    """Convert an array of counts to whole-number percentages of their sum."""
+    total = values.sum()
+    if total > 0:
+        return np.rint(values / total * 100).astype(np.int64).tolist()
+    return [0] * len(values)
+
+
 def load_data_from_aggregation_csv(url, scenario_name):
     """
     Load data from a single aggregation CSV file.
@@ -31,73 +115,39 @@ def load_data_from_aggregation_csv(url, scenario_name):
         if not url:
             return None
 
-        df = pd.read_csv(url)
+        df = _fetch_csv(url)
 
-        # Helper to get first row value or 0
-        def get_value(column):
-            if column in df.columns and len(df) > 0:
-                return df[column].iloc[0]
-            return 0
+        # Pull the single data row once, in NEEDED_COLS order, with 0 for absent columns
+        row = df.iloc[0] if len(df) > 0 else pd.Series(dtype=np.float64)
+        row = row.reindex(NEEDED_COLS, fill_value=0).to_numpy(dtype=np.float64)
 
         # Extract income bracket data
-        income_values = [
-            get_value("marketUnits050Sum"),
-            get_value("marketUnits51100Sum"),
-            get_value("marketUnits101150Sum"),
-            get_value("marketUnits151200Sum"),
-            get_value("marketUnits201250Sum"),
-            get_value("marketUnits251Sum"),
-        ]
-
-        total_income = sum(income_values)
-        income_pct = [
-            round(v / total_income * 100) if total_income > 0 else 0
-            for v in income_values
-        ]
+        income_values = row[0:6]
+        income_pct = _pct(income_values)
 
         # Extract bedroom count data
-        bedroom_values = [
-            get_value("countMarket0BrSum"),
-            get_value("countMarket1BrSum"),
-            get_value("countMarket2BrSum"),
-            get_value("countMarket3BrSum"),
-        ]
-
-        total_bedroom = sum(bedroom_values)
-        bedroom_pct = [
-            round(v / total_bedroom * 100) if total_bedroom > 0 else 0
-            for v in bedroom_values
-        ]
+        bedroom_values = row[6:10]
+        bedroom_pct = _pct(bedroom_values)
 
         # Extract parking data
-        parking_values = [
-            get_value("surfaceParkingStallsSum"),
-            get_value("garageParkingStallsSum"),
-            get_value("podiumParkingStallsSum"),
-            get_value("structuredParkingStallsSum"),
-            get_value("undergroundParkingStallsSum"),
-        ]
-
-        total_parking = sum(parking_values)
-        parking_pct = [
-            round(v / total_parking * 100) if total_parking > 0 else 0
-            for v in parking_values
-        ]
+        parking_values = row[10:15]
+        parking_pct = _pct(parking_values)
 
         # Get totals
-        total_units = get_value("totalUnitsSum")
-        affordable_units = get_value("affordableUnitsSum")
+        total_units = float(row[15])
+        affordable_units = float(row[16])
 
         return {
             "scenario_name": scenario_name,
-            "income_values": [round(v, 1) for v in income_values],
+            "income_values": np.round(income_values, 1).tolist(),
             "income_pct": income_pct,
-            "bedroom_values": [round(v, 1) for v in bedroom_values],
+            "bedroom_values": np.round(bedroom_values, 1).tolist(),
             "bedroom_pct": bedroom_pct,
-            "parking_values": [round(v, 1) for v in parking_values],
+            "parking_values": np.round(parking_values, 1).tolist(),
             "parking_pct": parking_pct,
             "total_units": total_units,
             "affordable_units": affordable_units,
+            "has_units": bool(row.any()),
         }
 
     except Exception as e:
@@ -108,41 +158,119 @@ def load_data_from_aggregation_csv(url, scenario_name):
         return None
 
 
+# Category labels, in the column order of NEEDED_COLS
+INCOME_BRACKETS = (
+    "<=50% MFI",
+    "51%-100% MFI",
+    "101-150% MFI",
+    "151-200% MFI",
+    "201-250% MFI",
+    ">251% MFI",
+)
+BEDROOM_COUNTS = ("0 bedrooms", "1 bedroom", "2 bedrooms", "3+ bedrooms")
+PARKING_TYPES = ("Surface", "Garage", "Podium", "Structured", "Underground")
+
 # Color schemes
 total_feasibility_color = "#D66E6C"
-building_type_colors = {
-    "Single": "#6B9BD1",
-    "Single w/ ADU": "#5DBDB4",
-    "Townhomes": "#F07D4A",
-    "Plexes": "#6FB573",
-    "Walkups": "#F4C04E",
-    "Podiums": "#D66E6C",
-    "Towers": "#5A7BC4",
-}
-
-income_bracket_colors = {
-    "<=50% MFI": "#5DBDB4",
-    "51%-100% MFI": "#F07D4A",
-    "101-150% MFI": "#6FB573",
-    "151-200% MFI": "#F4C04E",
-    "201-250% MFI": "#D66E6C",
-    ">251% MFI": "#6B9BD1",
-}
-
-bedroom_count_colors = {
-    "0 bedrooms": "#6FB573",
-    "1 bedroom": "#F4C04E",
-    "2 bedrooms": "#D66E6C",
-    "3+ bedrooms": "#6B9BD1",
-}
-
-parking_type_colors = {
-    "Surface": "#6FB573",
-    "Garage": "#F4C04E",
-    "Podium": "#D66E6C",
-    "Structured": "#6B9BD1",
-    "Underground": "#5DBDB4",
-}
+building_type_colors = MappingProxyType(
+    {
+        "Single": "#6B9BD1",
+        "Single w/ ADU": "#5DBDB4",
+        "Townhomes": "#F07D4A",
+        "Plexes": "#6FB573",
+        "Walkups": "#F4C04E",
+        "Podiums": "#D66E6C",
+        "Towers": "#5A7BC4",
+    }
+)
+
+income_bracket_colors = MappingProxyType(
+    {
+        "<=50% MFI": "#5DBDB4",
+        "51%-100% MFI": "#F07D4A",
+        "101-150% MFI": "#6FB573",
+        "151-200% MFI": "#F4C04E",
+        "201-250% MFI": "#D66E6C",
+        ">251% MFI": "#6B9BD1",
+    }
+)
+
+bedroom_count_colors = MappingProxyType(
+    {
+        "0 bedrooms": "#6FB573",
+        "1 bedroom": "#F4C04E",
+        "2 bedrooms": "#D66E6C",
+        "3+ bedrooms": "#6B9BD1",
+    }
+)
+
+parking_type_colors = MappingProxyType(
+    {
+        "Surface": "#6FB573",
+        "Garage": "#F4C04E",
+        "Podium": "#D66E6C",
+        "Structured": "#6B9BD1",
+        "Underground": "#5DBDB4",
+    }
+)
+
+# Colors in category order, passed positionally to the cached chart builders
+INCOME_COLOR_TUPLE = tuple(income_bracket_colors[b] for b in INCOME_BRACKETS)
+BEDROOM_COLOR_TUPLE = tuple(bedroom_count_colors[c] for c in BEDROOM_COUNTS)
+PARKING_COLOR_TUPLE = tuple(parking_type_colors[t] for t in PARKING_TYPES)
+
+# Chart layouts, built once; update_layout copies them into each figure. The
+# section layouts take their own copy of BASE_LAYOUT so no nested dict is
+# shared. They are passed to the cached chart builders as arguments, so
+# editing one also changes the cache key.
+
+# Layout settings shared by every chart
+BASE_LAYOUT = dict(
+    xaxis=dict(title="", tickfont=dict(size=14)),
+    plot_bgcolor="white",
+    margin=dict(l=0, r=20, t=30, b=30),
+)
+
+# Layout for the stacked percentage charts
+BASE_STACK_LAYOUT = dict(
+    copy.deepcopy(BASE_LAYOUT),
+    barmode="stack",
+    height=600,
+    yaxis=dict(
+        title="", showticklabels=False, showgrid=True, gridcolor="lightgray"
+    ),
+    legend=dict(
+        title="",
+        orientation="v",
+        yanchor="top",
+        y=1,
+        xanchor="left",
+        x=-0.15,
+        font=dict(size=12),
+        traceorder="normal",
+    ),
+)
+
+# Layout for the grouped total feasibility chart
+BASE_GROUPED_LAYOUT = dict(
+    copy.deepcopy(BASE_LAYOUT),
+    barmode="group",
+    height=400,
+    yaxis=dict(
+        title="",
+        showgrid=True,
+        gridcolor="lightgray",
+        showticklabels=False,
+    ),
+    showlegend=True,
+    legend=dict(
+        orientation="h",
+        yanchor="bottom",
+        y=1.02,
+        xanchor="right",
+        x=1,
+    ),
+)
 
 # ============================================================================
 # Chart Functions
@@ -150,65 +278,69 @@ parking_type_colors = {
 
 
 def create_multi_scenario_stacked_chart(all_data, categories, data_key, colors):
-    """Create stacked bar chart with multiple scenarios."""
+    """Create stacked bar chart with multiple scenarios.
+
+    colors is a tuple of marker colors in the same order as categories.
+    """
+    return _stacked_chart(all_data, categories, data_key, colors, BASE_STACK_LAYOUT)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _stacked_chart(all_data, categories, data_key, colors, layout):
+    """Build the stacked bar chart; the cached figure is shared, so don't modify it."""
     fig = go.Figure()
 
     # Get scenario names
     scenario_names = [d["scenario_name"] for d in all_data]
 
+    # Category x scenario matrix of values; each row is a view for one trace
+    values_matrix = np.asarray([d[data_key] for d in all_data], dtype=np.int64).T
+
+    if not values_matrix.any():
+        fig.update_layout(layout, xaxis_visible=False, yaxis_visible=False)
+        fig.add_annotation(text="No data", showarrow=False)
+        return fig
+
+    textfont = dict(color="white", size=14)
+
     # Add bars for each category in normal order
-    for i in range(len(categories)):
-        category = categories[i]
-        # Get values for this category across all scenarios
-        if data_key == "income_pct":
-            values = [d["income_pct"][i] for d in all_data]
-        elif data_key == "bedroom_pct":
-            values = [d["bedroom_pct"][i] for d in all_data]
-        elif data_key == "parking_pct":
-            values = [d["parking_pct"][i] for d in all_data]
-
-        fig.add_trace(
-            go.Bar(
-                name=category,
-                x=scenario_names,
-                y=values,
-                marker_color=colors[category],
-                text=[f"{v}%" if v > 0 else "" for v in values],
-                textposition="inside",
-                textfont=dict(color="white", size=14),
-                hovertemplate=f"{category}: %{{y}}%<extra></extra>",
-            )
+    for i, category in enumerate(categories):
+        values = values_matrix[i]
+        fig.add_bar(
+            name=category,
+            x=scenario_names,
+            y=values,
+            marker_color=colors[i],
+            text=np.where(values > 0, np.char.add(values.astype("U8"), "%"), ""),
+            textposition="inside",
+            textfont=textfont,
+            hovertemplate=f"{category}: %{{y}}%<extra></extra>",
         )
 
     # Update layout
-    fig.update_layout(
-        barmode="stack",
-        height=600,
-        xaxis=dict(title="", tickfont=dict(size=14)),
-        yaxis=dict(
-            title="", showticklabels=False, showgrid=True, gridcolor="lightgray"
-        ),
-        legend=dict(
-            title="",
-            orientation="v",
-            yanchor="top",
-            y=1,
-            xanchor="left",
-            x=-0.15,
-            font=dict(size=12),
-            traceorder="normal",
-        ),
-        plot_bgcolor="white",
-        margin=dict(l=0, r=20, t=30, b=30),
-    )
+    fig.update_layout(layout)
 
     return fig
 
 
 def create_total_feasibility_chart_grouped(scenario_names, total_data_dict, color):
     """Create grouped bar chart for total units vs affordable units."""
+    return _total_chart(scenario_names, total_data_dict, color, BASE_GROUPED_LAYOUT)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _total_chart(scenario_names, total_data_dict, color, layout):
+    """Build the grouped total feasibility chart; the cached figure is shared."""
     fig = go.Figure()
 
+    total_units = np.asarray(total_data_dict["Total Units"])
+    affordable_units = np.asarray(total_data_dict["Affordable Units"])
+
+    if not (total_units.any() or affordable_units.any()):
+        fig.update_layout(layout, xaxis_visible=False, yaxis_visible=False)
+        fig.add_annotation(text="No data", showarrow=False)
+        return fig
+
     # Add Total Units bar
     fig.add_trace(
         go.Bar(
@@ -216,7 +348,7 @@ def create_total_feasibility_chart_grouped(scenario_names, total_data_dict, colo
             x=scenario_names,
             y=total_data_dict["Total Units"],
             marker_color=color,
-            text=[f"{int(v)}" for v in total_data_dict["Total Units"]],
+            text=total_units.astype(int).astype(str),
             textposition="inside",
             textfont=dict(color="white", size=14, weight="bold"),
             hovertemplate="Total Units: %{y}<extra></extra>",
@@ -224,14 +356,12 @@ def create_total_feasibility_chart_grouped(scenario_names, total_data_dict, colo
     )
 
     # Add Affordable Units bar with minimum display value
-    max_value = max(
-        max(total_data_dict["Total Units"]), max(total_data_dict["Affordable Units"])
-    )
+    max_value = float(np.max(np.concatenate([total_units, affordable_units])))
     min_display_value = max_value * 0.01
 
-    affordable_display = [
-        val if val > 0 else min_display_value for val in total_data_dict["Affordable Units"]
-    ]
+    affordable_display = np.where(
+        affordable_units > 0, affordable_units, min_display_value
+    )
 
     fig.add_trace(
         go.Bar(
@@ -239,10 +369,9 @@ def create_total_feasibility_chart_grouped(scenario_names, total_data_dict, colo
             x=scenario_names,
             y=affordable_display,
             marker_color="#5DBDB4",
-            text=[
-                f"{int(actual)}" if actual > 0 else ""
-                for actual in total_data_dict["Affordable Units"]
-            ],
+            text=np.where(
+                affordable_units > 0, affordable_units.astype(int).astype(str), ""
+            ),
             textposition="inside",
             textfont=dict(color="white", size=14, weight="bold"),
             hovertemplate="Affordable Units: %{customdata}<extra></extra>",
@@ -251,31 +380,62 @@ def create_total_feasibility_chart_grouped(scenario_names, total_data_dict, colo
     )
 
     # Update layout
-    fig.update_layout(
-        barmode="group",
-        height=400,
-        xaxis=dict(title="", tickfont=dict(size=14)),
-        yaxis=dict(
-            title="",
-            showgrid=True,
-            gridcolor="lightgray",
-            showticklabels=False,
-        ),
-        plot_bgcolor="white",
-        margin=dict(l=0, r=20, t=30, b=30),
-        showlegend=True,
-        legend=dict(
-            orientation="h",
-            yanchor="bottom",
-            y=1.02,
-            xanchor="right",
-            x=1,
-        ),
-    )
+    fig.update_layout(layout)
 
     return fig
 
 
+# ============================================================================
+# Dashboard Sections
+# ============================================================================
+
+
+def render_feasibility_section(all_data):
+    """Render the total feasibility chart and its data table."""
+    st.title("Market-Feasible Units Dashboard")
+    scenario_names = [d["scenario_name"] for d in all_data]
+    total_data_dict = {
+        "Total Units": [d["total_units"] for d in all_data],
+        "Affordable Units": [d["affordable_units"] for d in all_data],
+    }
+
+    df_total = pd.DataFrame(
+        _whole_numbers(list(total_data_dict.values())),
+        index=list(total_data_dict),
+        columns=scenario_names,
+    )
+
+    # Create grouped bar chart for total feasibility
+    fig_total = create_total_feasibility_chart_grouped(
+        scenario_names, total_data_dict, total_feasibility_color
+    )
+
+    st.plotly_chart(fig_total, use_container_width=True, key="total_chart")
+    st.subheader("Feasibility Data")
+    st.dataframe(df_total, use_container_width=True)
+
+
+def render_stacked_section(all_data, title, table_title, categories, prefix, colors):
+    """Render a stacked percentage chart with a table of the underlying values.
+
+    prefix selects the "<prefix>_values" and "<prefix>_pct" entries of each
+    scenario's data.
+    """
+    st.title(title)
+    scenario_names = [d["scenario_name"] for d in all_data]
+
+    # Create dataframe for display (actual values)
+    values = _whole_numbers([d[f"{prefix}_values"] for d in all_data])
+    df_values = pd.DataFrame(values.T, index=categories, columns=scenario_names)
+
+    fig = create_multi_scenario_stacked_chart(
+        all_data, categories, f"{prefix}_pct", colors
+    )
+    st.plotly_chart(fig, use_container_width=True, key=f"{prefix}_chart")
+    st.subheader(table_title)
+    st.dataframe(df_values, use_container_width=True)
+
+
 # ============================================================================
 # Main Dashboard
 # ============================================================================
@@ -315,122 +475,72 @@ if not unzoned_csv_url and not zoned_scenarios:
     )
     st.stop()
 
-# Load all data
-all_data = []
-
-# Load unzoned baseline first (will be leftmost in charts)
+# Load all data (unzoned baseline first so it is leftmost in charts)
+tasks = [(s["url"], s["name"]) for s in zoned_scenarios]
 if unzoned_csv_url:
-    unzoned_data = load_data_from_aggregation_csv(unzoned_csv_url, "Unzoned")
-    if unzoned_data:
-        all_data.append(unzoned_data)
+    tasks.insert(0, (unzoned_csv_url, "Unzoned"))
 
-# Load all zoned scenarios
-for scenario in zoned_scenarios:
-    scenario_data = load_data_from_aggregation_csv(scenario["url"], scenario["name"])
-    if scenario_data:
-        all_data.append(scenario_data)
+script_ctx = get_script_run_ctx()
 
-# Check if we successfully loaded any data
-if not all_data:
-    st.error("Failed to load any data. Please check the URLs and try again.")
-    st.stop()
 
-# Define category labels
-income_brackets = [
-    "<=50% MFI",
-    "51%-100% MFI",
-    "101-150% MFI",
-    "151-200% MFI",
-    "201-250% MFI",
-    ">251% MFI",
-]
-bedroom_counts = ["0 bedrooms", "1 bedroom", "2 bedrooms", "3+ bedrooms"]
-parking_types = ["Surface", "Garage", "Podium", "Structured", "Underground"]
+def load_task(task):
+    # Attach the script context so st.error calls from worker threads render
+    add_script_run_ctx(threading.current_thread(), script_ctx)
+    return load_data_from_aggregation_csv(*task)
 
-# Define category labels
-income_brackets = [
-    "<=50% MFI",
-    "51%-100% MFI",
-    "101-150% MFI",
-    "151-200% MFI",
-    "201-250% MFI",
-    ">251% MFI",
-]
-bedroom_counts = ["0 bedrooms", "1 bedroom", "2 bedrooms", "3+ bedrooms"]
-parking_types = ["Surface", "Garage", "Podium", "Structured", "Underground"]
 
-# Chart 1: Total Feasibility
-st.title("Market-Feasible Units Dashboard")
-total_data_dict = {"Total Units": [], "Affordable Units": []}
-scenario_names = []
-for data in all_data:
-    scenario_names.append(data["scenario_name"])
-    total_data_dict["Total Units"].append(data["total_units"])
-    total_data_dict["Affordable Units"].append(data["affordable_units"])
+# Fetch all CSVs concurrently; map preserves the scenario order
+with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+    loaded_data = [data for data in executor.map(load_task, tasks) if data]
+
+# Check if we successfully loaded any data
+if not loaded_data:
+    st.error("Failed to load any data. Please check the URLs and try again.")
+    st.stop()
 
-df_total = pd.DataFrame(total_data_dict, index=scenario_names)
+# Skip scenarios with nothing to chart
+all_data = []
+for data in loaded_data:
+    if data["has_units"]:
+        all_data.append(data)
+    else:
+        st.warning(f"No units found for {data['scenario_name']}; skipping it.")
 
-# Create grouped bar chart for total feasibility
-fig_total = create_total_feasibility_chart_grouped(scenario_names, total_data_dict, total_feasibility_color)
+if not all_data:
+    st.error("No units found in any scenario; there is nothing to chart.")
+    st.stop()
 
-st.plotly_chart(fig_total, use_container_width=True)
-st.subheader("Feasibility Data")
-st.dataframe(df_total.T, use_container_width=True)
+render_feasibility_section(all_data)
 
 st.markdown("---")
 
-# Chart 3: Income Brackets
-st.title("Market-feasible units affordable to different income brackets")
-income_data_values = {bracket: [] for bracket in income_brackets}
-income_data_pct = {bracket: [] for bracket in income_brackets}
-for data in all_data:
-    for i, bracket in enumerate(income_brackets):
-        income_data_values[bracket].append(data["income_values"][i])
-        income_data_pct[bracket].append(data["income_pct"][i])
-
-# Create dataframe for display (actual values)
-df_income = pd.DataFrame(income_data_values, index=scenario_names)
-fig_income = create_multi_scenario_stacked_chart(
-    all_data, income_brackets, "income_pct", income_bracket_colors
+render_stacked_section(
+    all_data,
+    "Market-feasible units affordable to different income brackets",
+    "Income Bracket Data",
+    INCOME_BRACKETS,
+    "income",
+    INCOME_COLOR_TUPLE,
 )
-st.plotly_chart(fig_income, use_container_width=True)
-st.subheader("Income Bracket Data")
-st.dataframe(df_income.T, use_container_width=True)
 
 st.markdown("---")
 
-# Chart 4: Bedroom Counts
-st.title("Market-feasible units by bedroom count")
-bedroom_data_values = {count: [] for count in bedroom_counts}
-bedroom_data_pct = {count: [] for count in bedroom_counts}
-for data in all_data:
-    for i, count in enumerate(bedroom_counts):
-        bedroom_data_values[count].append(data["bedroom_values"][i])
-        bedroom_data_pct[count].append(data["bedroom_pct"][i])
-
-df_bedrooms = pd.DataFrame(bedroom_data_values, index=scenario_names)
-fig_bedrooms = create_multi_scenario_stacked_chart(
-    all_data, bedroom_counts, "bedroom_pct", bedroom_count_colors
+render_stacked_section(
+    all_data,
+    "Market-feasible units by bedroom count",
+    "Bedroom Count Data",
+    BEDROOM_COUNTS,
+    "bedroom",
+    BEDROOM_COLOR_TUPLE,
 )
-st.plotly_chart(fig_bedrooms, use_container_width=True)
-st.subheader("Bedroom Count Data")
-st.dataframe(df_bedrooms.T, use_container_width=True)
 
 st.markdown("---")
 
-# Chart 5: Parking Types
-st.title("Parking stalls by type")
-parking_data_values = {ptype: [] for ptype in parking_types}
-parking_data_pct = {ptype: [] for ptype in parking_types}
-for data in all_data:
-    for i, ptype in enumerate(parking_types):
-        parking_data_values[ptype].append(data["parking_values"][i])
-        parking_data_pct[ptype].append(data["parking_pct"][i])
-
-df_parking = pd.DataFrame(parking_data_values, index=scenario_names)
-fig_parking = create_multi_scenario_stacked_chart(
-    all_data, parking_types, "parking_pct", parking_type_colors
+render_stacked_section(
+    all_data,
+    "Parking stalls by type",
+    "Parking Data",
+    PARKING_TYPES,
+    "parking",
+    PARKING_COLOR_TUPLE,
 )
-st.plotly_chart(fig_parking, use_container_width=True)
-st.subheader("Parking Data")
-st.dataframe(df_parking.T, use_container_width=True)